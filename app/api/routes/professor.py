@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -22,11 +22,16 @@ class StudentScheme(BaseModel):
     salary: Optional[int]
 
 
-@router.get("/", response_model=List[Professors])
-async def get_all_profs() -> List[Professors] | HTTPException:
+@router.get("/", response_model=None)
+async def get_all_profs(fields: Optional[str] = None) -> List[Professors] | List[Dict[str, Any]] | HTTPException:
+    try:
+        selected_fields = repos.ProfessorRepository.parse_fields(fields) if fields is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Bad fields parameter.\nCause:{e}")
+
     try:
         with async_sessionmaker() as session:
-            professors = await repos.ProfessorRepository.all(session)
+            professors = await repos.ProfessorRepository.all(session, selected_fields)
             await session.commit()
 
         return list(professors)
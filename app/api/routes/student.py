@@ -1,5 +1,5 @@
 import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -21,11 +21,16 @@ class StudentScheme(BaseModel):
     email: Optional[str]
 
 
-@router.get("/", response_model=List[Students])
-async def get_all_students() -> List[Students] | HTTPException:
+@router.get("/", response_model=None)
+async def get_all_students(fields: Optional[str] = None) -> List[Students] | List[Dict[str, Any]] | HTTPException:
+    try:
+        selected_fields = repos.StudentRepository.parse_fields(fields) if fields is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Bad fields parameter.\nCause:{e}")
+
     try:
         with async_sessionmaker() as session:
-            students = await repos.StudentRepository.all(session)
+            students = await repos.StudentRepository.all(session, selected_fields)
             await session.commit()
 
         return list(students)
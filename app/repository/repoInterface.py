@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 class RepositoryInterface(ABC):
 
     @abstractmethod
-    def all(self, session):
+    def all(self, session, fields=None):
         raise NotImplemented
 
     @abstractmethod
@@ -1,6 +1,6 @@
-from typing import Sequence, Type, Dict
+from typing import Any, Sequence, Type, Dict, List
 
-from sqlalchemy import select, text
+from sqlalchemy import inspect, select, text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from app.repository.repoInterface import RepositoryInterface
@@ -11,7 +11,36 @@ class SqlalchemyRepository[T](RepositoryInterface):
     def __init__(self, scheme_model: T):
         self._scheme_model = scheme_model
 
-    async def all(self, session: AsyncSession) -> Sequence[T]:
+    def column_names(self) -> List[str]:
+        return [column.key for column in inspect(self._scheme_model).column_attrs]
+
+    def parse_fields(self, fields: str) -> List[str]:
+        """
+        Разбирает строку вида "first_name,last_name" в список колонок модели.
+        Бросает ValueError, если какой-то колонки в модели нет или список пуст.
+        """
+        columns = self.column_names()
+        parsed = [field.strip() for field in fields.split(",") if field.strip()]
+
+        unknown = [field for field in parsed if field not in columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(columns)}")
+
+        if not parsed:
+            raise ValueError(f"No fields given. Allowed: {', '.join(columns)}")
+
+        return list(dict.fromkeys(parsed))
+
+    async def all(
+            self,
+            session: AsyncSession,
+            fields: Sequence[str] | None = None
+    ) -> Sequence[T] | List[Dict[str, Any]]:
+        if fields:
+            req = select(*(getattr(self._scheme_model, field) for field in fields))
+            rows_future = await session.execute(req)
+            return [dict(row._mapping) for row in rows_future]
+
         req = select(self._scheme_model)
         rows_future = await session.scalars(req)
         result_rows = rows_future.all()
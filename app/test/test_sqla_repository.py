@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.repository import ProfessorRepository, StudentRepository
+from app.repository.sqlaRepository import SqlalchemyRepository
+
+
+def test_column_names_are_mapped_columns_only():
+    assert ProfessorRepository.column_names() == [
+        "professor_id", "last_name", "first_name", "current_position", "experience",
+        "patronymic", "degree", "academic_title", "salary",
+    ]
+
+
+def test_parse_fields_strips_whitespace():
+    assert StudentRepository.parse_fields(" first_name , email ") == ["first_name", "email"]
+
+
+def test_parse_fields_drops_duplicates_keeping_order():
+    assert StudentRepository.parse_fields("email,first_name,email") == ["email", "first_name"]
+
+
+def test_parse_fields_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown fields: password"):
+        StudentRepository.parse_fields("first_name,password")
+
+
+def test_parse_fields_rejects_relationships():
+    with pytest.raises(ValueError, match="Unknown fields: fields"):
+        ProfessorRepository.parse_fields("last_name,fields")
+
+
+@pytest.mark.parametrize("raw", ["", " ", ",,", " , "])
+def test_parse_fields_rejects_empty_input(raw):
+    with pytest.raises(ValueError, match="No fields given"):
+        ProfessorRepository.parse_fields(raw)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Person(_Base):
+    __tablename__ = "person"
+
+    person_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(30))
+    secret: Mapped[str] = mapped_column(String(30))
+
+
+def _run_all(fields):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(_Base.metadata.create_all)
+
+        async with async_sessionmaker(engine)() as session:
+            session.add_all([
+                _Person(person_id=1, name="Ivan", secret="a"),
+                _Person(person_id=2, name="Olga", secret="b"),
+            ])
+            await session.commit()
+
+            rows = await SqlalchemyRepository[_Person](_Person).all(session, fields)
+            await session.commit()
+
+        await engine.dispose()
+        return rows
+
+    return asyncio.run(run())
+
+
+def test_all_with_fields_returns_only_requested_columns():
+    rows = _run_all(["name"])
+
+    assert rows == [{"name": "Ivan"}, {"name": "Olga"}]
+
+
+def test_all_without_fields_returns_models():
+    rows = _run_all(None)
+
+    assert [type(row) for row in rows] == [_Person, _Person]